@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import sys
 
 from service.filecleaner import FileCleaner
@@ -22,14 +23,16 @@ def main() -> int:
             logger.error("対象ディレクトリが設定されていません")
             return 1
 
-        if '*' in cleaner.target_extensions:
+        if cleaner.delete_all_extensions:
             print("対象: すべてのファイル")
         else:
             print(f"対象拡張子: {', '.join(cleaner.target_extensions)}")
 
-        print(f"対象ディレクトリ: {len(cleaner.target_dirs)} 件")
-        for i, dir_path in enumerate(cleaner.target_dirs, 1):
-            print(f"  {i}. {dir_path}")
+        dir_lines = [f"対象ディレクトリ: {len(cleaner.target_dirs)} 件"]
+        dir_lines.extend(
+            f"  {i}. {dir_path}" for i, dir_path in enumerate(cleaner.target_dirs, 1)
+        )
+        print("\n".join(dir_lines))
 
         results = cleaner.clean_all()
         logger.info("ファイルクリーナーが正常に完了しました")
@@ -51,4 +54,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # PyInstallerでビルドした実行ファイルでProcessPoolExecutorを使うために必要
+    multiprocessing.freeze_support()
     sys.exit(main())
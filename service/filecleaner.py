@@ -1,11 +1,46 @@
 import configparser
+import errno
 import logging
+import math
+import multiprocessing
+import os
+import re
 import shutil
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.queues import Queue
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from utils.config_manager import get_config_value, load_config
+from utils.scan_cache import load_cache, save_cache
+
+_JST = ZoneInfo("Asia/Tokyo")
+# カンマ区切りの拡張子から前後の空白と先頭のドットを除いた各要素を取り出す
+_EXT_RE = re.compile(r'[\s.]*([^,\s.](?:[^,]*[^,\s])?)')
+# Asia/Tokyoは夏時間がないため固定オフセットで現地時刻に変換できる
+_JST_OFFSET_SECONDS = (datetime.now(_JST).utcoffset() or timedelta()).total_seconds()
+
+
+def _format_jst(timestamp: float) -> str:
+    """POSIXタイムスタンプをdatetimeを生成せずに日本時間の文字列へ変換"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(timestamp + _JST_OFFSET_SECONDS))
+
+
+def _init_worker_logging(log_queue: "Queue[logging.LogRecord]", level: int) -> None:
+    """ワーカープロセスのログをキュー経由で親プロセスへ転送するよう設定"""
+    root_logger = logging.getLogger()
+    # ログファイルへの書き込みとローテーションは親プロセスのハンドラだけに任せる
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
 
 
 class FileCleaner:
@@ -16,9 +51,17 @@ class FileCleaner:
         self.logger = logging.getLogger(__name__)
         self.target_dirs: list[str] = []
         self.target_extensions: list[str] = []
+        self._target_ext_set: frozenset[str] = frozenset()
+        self.delete_all_extensions = False
         self.file_cleanup_hour: int = 1
-        self.app_start_time = datetime.now(ZoneInfo("Asia/Tokyo"))
+        self.threads: int = 8
+        self.parallel_dirs = False
+        self.scan_cache = False
+        self._skip_age_check = False
+        self._app_start_ts = time.time()
+        self.app_start_time = datetime.fromtimestamp(self._app_start_ts, _JST)
         self._load_settings()
+        self._cutoff_ts = self._app_start_ts - self.file_cleanup_hour * 3600
 
     def _load_settings(self) -> None:
         """設定ファイルから対象ディレクトリと拡張子を読み込む"""
@@ -33,24 +76,38 @@ class FileCleaner:
                 self.target_extensions = ['*']
             else:
                 self.target_extensions = [
-                    ext.strip().lower().lstrip('.')
-                    for ext in extensions_str.split(',')
-                    if ext.strip()
+                    match.group(1).lower() for match in _EXT_RE.finditer(extensions_str)
                 ]
-
-        cleanup_hour_str = get_config_value(
-            self.config, 'Settings', 'file_cleanup_hour', '24'
-        )
+        self._target_ext_set = frozenset(self.target_extensions)
+        self.delete_all_extensions = '*' in self._target_ext_set
+
+        self.file_cleanup_hour = self._get_int_setting('file_cleanup_hour', 24)
+        # 全拡張子かつ保持期間なしの場合は更新日時を確認せずにすべて削除する
+        self._skip_age_check = self.delete_all_extensions and self.file_cleanup_hour <= 0
+        self.threads = max(1, self._get_int_setting('threads', 8))
+        self.parallel_dirs = self._get_bool_setting('parallel_dirs', False)
+        self.scan_cache = self._get_bool_setting('scan_cache', False)
+
+        self.logger.info("対象ディレクトリ: %s", self.target_dirs)
+        self.logger.info("対象拡張子: %s", self.target_extensions)
+
+    def _get_int_setting(self, key: str, default: int) -> int:
+        """Settingsセクションから整数値を取得し、不正な値の場合はデフォルト値を返す"""
+        value = get_config_value(self.config, 'Settings', key, str(default))
         try:
-            self.file_cleanup_hour = int(cleanup_hour_str or '24')
+            return int(value or default)
         except (ValueError, TypeError):
-            self.logger.warning(
-                f"file_cleanup_hour の値が不正です: {cleanup_hour_str}。デフォルト値を使用します"
-            )
-            self.file_cleanup_hour = 24
+            self.logger.warning("%s の値が不正です: %s。デフォルト値を使用します", key, value)
+            return default
 
-        self.logger.info(f"対象ディレクトリ: {self.target_dirs}")
-        self.logger.info(f"対象拡張子: {self.target_extensions}")
+    def _get_bool_setting(self, key: str, default: bool) -> bool:
+        """Settingsセクションから真偽値を取得し、不正な値の場合はデフォルト値を返す"""
+        try:
+            return bool(get_config_value(self.config, 'Settings', key, default))
+        except ValueError:
+            value = self.config.get('Settings', key, fallback=None)
+            self.logger.warning("%s の値が不正です: %s。デフォルト値を使用します", key, value)
+            return default
 
     def _get_target_directories(self) -> list[str]:
         """Pathsセクションからtarget_dirで始まるすべてのディレクトリを取得"""
@@ -60,82 +117,121 @@ class FileCleaner:
             self.logger.warning("設定ファイルにPathsセクションがありません")
             return directories
 
-        for key in self.config.options('Paths'):
-            if key.startswith('target_dir'):
-                value = self.config.get('Paths', key)
-                if value and value.strip():
-                    directories.append(value.strip())
+        for key, value in self.config.items('Paths'):
+            if key.startswith('target_dir') and value and value.strip():
+                directories.append(value.strip())
 
         return directories
 
-    def _is_file_old_enough(self, file_path: Path) -> bool:
+    def _is_file_old_enough(self, file_path: str | Path | os.DirEntry[str]) -> bool:
         """ファイルが削除対象の期間より古いかを判定"""
         try:
-            stat_info = file_path.stat()
-            file_modification_time = datetime.fromtimestamp(
-                stat_info.st_mtime, ZoneInfo("Asia/Tokyo")
+            mtime = self._mtime(file_path)
+        except OSError as e:
+            self.logger.warning(
+                "ファイル更新時刻の取得に失敗しました: %s - %s", os.fspath(file_path), e
             )
-            cutoff_time = self.app_start_time - timedelta(hours=self.file_cleanup_hour)
+            return False
 
-            is_old = file_modification_time < cutoff_time
+        is_old = mtime < self._cutoff_ts
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_file_age(os.fspath(file_path), mtime, is_old)
+        return is_old
+
+    @staticmethod
+    def _mtime(file_path: str | Path | os.DirEntry[str]) -> float:
+        """更新日時を取得し、DirEntryの場合はscandir時に取得済みの情報を利用する"""
+        if isinstance(file_path, str):
+            return os.stat(file_path, follow_symlinks=False).st_mtime
+        return file_path.stat(follow_symlinks=False).st_mtime
+
+    def _log_file_age(self, file_path: str, mtime: float, is_old: bool) -> None:
+        """ファイルの更新日時と基準時刻をデバッグログに出力"""
+        status = "削除対象です" if is_old else "削除対象外です"
+        self.logger.debug(
+            "ファイルは%s: %s (更新日時: %s, 基準時刻: %s)",
+            status,
+            file_path,
+            _format_jst(mtime),
+            _format_jst(self._cutoff_ts)
+        )
 
-            if is_old:
-                self.logger.debug(
-                    f"ファイルは削除対象です: {file_path} "
-                    f"(更新日時: {file_modification_time.strftime('%Y-%m-%d %H:%M:%S')}, "
-                    f"基準時刻: {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')})"
-                )
-            else:
-                self.logger.debug(
-                    f"ファイルは削除対象外です: {file_path} "
-                    f"(更新日時: {file_modification_time.strftime('%Y-%m-%d %H:%M:%S')}, "
-                    f"基準時刻: {cutoff_time.strftime('%Y-%m-%d %H:%M:%S')})"
-                )
-
-            return is_old
-        except (OSError, ValueError) as e:
-            self.logger.warning(f"ファイル更新時刻の取得に失敗しました: {file_path} - {e}")
-            return False
+    @staticmethod
+    def _ext_of(name: str) -> str:
+        """ファイル名から小文字の拡張子を取得し、拡張子がない場合は空文字を返す"""
+        # Path.suffixと同様に、先頭のドットのみのドットファイルは拡張子なしとする
+        dot = name.rfind('.')
+        return name[dot + 1:].lower() if dot > 0 else ''
 
-    def _should_delete_file(self, file_path: Path) -> bool:
-        """ファイルが削除対象かどうかを判定"""
-        extension_match = False
+    def _matches_extension(self, name: str) -> bool:
+        """ファイル名の拡張子が削除対象かどうかを判定"""
+        return self.delete_all_extensions or self._ext_of(name) in self._target_ext_set
 
-        if '*' in self.target_extensions:
-            extension_match = True
-        else:
-            extension = file_path.suffix.lower().lstrip('.')
-            extension_match = extension in self.target_extensions
+    def _should_delete_file(self, entry: Path | os.DirEntry[str]) -> bool:
+        """ファイルが削除対象かどうかを判定"""
+        if self._skip_age_check:
+            return True
 
-        if not extension_match:
+        if not self._matches_extension(entry.name):
             return False
 
-        return self._is_file_old_enough(file_path)
-
-    def _delete_file(self, file_path: Path) -> bool:
+        # DirEntry.stat()はscandir時の情報をキャッシュするためstatは高々1回で済む
+        return self._is_file_old_enough(entry)
+
+    def _make_classifier(self) -> Callable[[os.DirEntry[str]], bool]:
+        """設定値を束縛した削除対象判定関数を作成し、走査ループ内の属性参照と分岐を省く"""
+        # デバッグログは判定ごとに出力するため汎用の判定処理を使う
+        if self._skip_age_check or self.logger.isEnabledFor(logging.DEBUG):
+            return self._should_delete_file
+
+        cutoff = self._cutoff_ts
+        # 取得に失敗した場合の警告出力は汎用の判定処理に任せる
+        is_old_enough = self._is_file_old_enough
+
+        if self.delete_all_extensions:
+            def classify_any(entry: os.DirEntry[str]) -> bool:
+                try:
+                    return entry.stat(follow_symlinks=False).st_mtime < cutoff
+                except OSError:
+                    return is_old_enough(entry)
+            return classify_any
+
+        ext_set = self._target_ext_set
+        ext_of = self._ext_of
+
+        def classify_ext(entry: os.DirEntry[str]) -> bool:
+            if ext_of(entry.name) not in ext_set:
+                return False
+            try:
+                return entry.stat(follow_symlinks=False).st_mtime < cutoff
+            except OSError:
+                return is_old_enough(entry)
+        return classify_ext
+
+    def _delete_file(self, file_path: str | Path) -> bool:
         """ファイルを削除"""
         try:
-            file_path.unlink()
-            self.logger.info(f"ファイルを削除しました: {file_path}")
+            os.unlink(file_path)
+            self.logger.info("ファイルを削除しました: %s", file_path)
             return True
         except PermissionError:
-            self.logger.error(f"ファイルの削除権限がありません: {file_path}")
+            self.logger.error("ファイルの削除権限がありません: %s", file_path)
             return False
         except OSError as e:
-            self.logger.error(f"ファイル削除中にエラーが発生しました: {file_path} - {e}")
+            self.logger.error("ファイル削除中にエラーが発生しました: %s - %s", file_path, e)
             return False
 
-    def _delete_directory(self, dir_path: Path) -> bool:
+    def _delete_directory(self, dir_path: str | Path) -> bool:
         """ディレクトリを再帰的に削除"""
         try:
             shutil.rmtree(dir_path)
-            self.logger.info(f"ディレクトリを削除しました: {dir_path}")
+            self.logger.info("ディレクトリを削除しました: %s", dir_path)
             return True
         except PermissionError:
-            self.logger.error(f"ディレクトリの削除権限がありません: {dir_path}")
+            self.logger.error("ディレクトリの削除権限がありません: %s", dir_path)
             return False
         except OSError as e:
-            self.logger.error(f"ディレクトリ削除中にエラーが発生しました: {dir_path} - {e}")
+            self.logger.error("ディレクトリ削除中にエラーが発生しました: %s - %s", dir_path, e)
             return False
 
     def clean_directory(self, directory: str) -> dict[str, int]:
@@ -148,101 +244,247 @@ class FileCleaner:
         Returns:
             削除結果の統計情報
         """
-        result = {
-            'deleted_files': 0,
-            'deleted_dirs': 0,
-            'failed_files': 0,
-            'failed_dirs': 0,
-            'skipped_files': 0
-        }
+        return self._clean_directory_tracked(directory)[0]
 
-        target_path = Path(directory)
-
-        if not target_path.exists():
-            self.logger.warning(f"ディレクトリが存在しません: {directory}")
-            return result
-
-        if not target_path.is_dir():
-            self.logger.warning(f"指定されたパスはディレクトリではありません: {directory}")
-            return result
+    def _clean_directory_tracked(
+        self, directory: str
+    ) -> tuple[dict[str, int], dict[str, Any] | None]:
+        """
+        ディレクトリをクリーンアップし、スキャンキャッシュに記録する状態も併せて返す
 
-        self.logger.info(f"クリーンアップを開始します: {directory}")
+        Returns:
+            (削除結果の統計情報, キャッシュに記録する状態。記録できない場合はNone)
+        """
+        scan_start = time.time()
+        # 存在確認とディレクトリ判定を個別に行わず、scandirの例外で判別する
+        try:
+            scandir_it = os.scandir(directory)
+        except FileNotFoundError:
+            self.logger.warning("ディレクトリが存在しません: %s", directory)
+            return self._make_result(), None
+        except NotADirectoryError:
+            self.logger.warning("指定されたパスはディレクトリではありません: %s", directory)
+            return self._make_result(), None
+
+        self.logger.info("クリーンアップを開始します: %s", directory)
+
+        with scandir_it:
+            result, cacheable, next_due = self._clean_entries(scandir_it)
+
+        if not cacheable or result['failed_files'] or result['failed_dirs']:
+            return result, None
+        return result, self._make_cache_entry(directory, next_due, scan_start)
+
+    def _clean_entries(
+        self, entries: Iterator[os.DirEntry[str]]
+    ) -> tuple[dict[str, int], bool, float]:
+        """
+        対象ディレクトリ直下のエントリを種類ごとに処理する
 
-        items = list(target_path.iterdir())
+        Returns:
+            (削除結果の統計情報, キャッシュに記録できるか, 残ったファイルの最も古い更新日時)
+        """
+        result = self._make_result()
+        file_futures: list[Future[bool]] = []
+        dir_futures: list[Future[bool]] = []
+        # 残ったファイルのうち最も古い更新日時を走査と同時に求め、再走査を不要にする
+        cacheable = self.scan_cache
+        next_due = math.inf
+
+        should_delete = self._make_classifier()
+
+        # エントリを一覧化せず、走査しながら削除タスクを投入する
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    if should_delete(entry):
+                        file_futures.append(executor.submit(self._delete_file, entry.path))
+                        continue
+                    result['skipped_files'] += 1
+                    self.logger.debug("削除対象外ファイルをスキップしました: %s", entry.path)
+                    if cacheable and self._matches_extension(entry.name):
+                        try:
+                            next_due = min(next_due, entry.stat(follow_symlinks=False).st_mtime)
+                        except OSError:
+                            cacheable = False
+
+                elif entry.is_dir(follow_symlinks=False):
+                    # サブディレクトリ内の変更は直下の更新日時で検知できないためキャッシュしない
+                    cacheable = cacheable and self.delete_all_extensions
+                    self._clean_subdirectory(entry.path, executor, dir_futures, result)
 
-        for item in items:
-            if item.is_file():
-                if self._should_delete_file(item):
-                    if self._delete_file(item):
-                        result['deleted_files'] += 1
-                    else:
-                        result['failed_files'] += 1
                 else:
+                    # シンボリックリンクなどはリンク先を辿らずスキップ扱いにする
+                    cacheable = False
                     result['skipped_files'] += 1
-                    self.logger.debug(f"削除対象外ファイルをスキップしました: {item}")
-
-            elif item.is_dir():
-                if '*' in self.target_extensions:
-                    if self._delete_directory(item):
-                        result['deleted_dirs'] += 1
-                    else:
-                        result['failed_dirs'] += 1
-                else:
-                    # 特定の拡張子のみ対象の場合はサブディレクトリも再帰的に処理
-                    sub_result = self._clean_directory_recursive(item)
-                    result['deleted_files'] += sub_result['deleted_files']
-                    result['failed_files'] += sub_result['failed_files']
-                    result['skipped_files'] += sub_result['skipped_files']
-                    result['deleted_dirs'] += sub_result['deleted_dirs']
-                    result['failed_dirs'] += sub_result['failed_dirs']
+                    self.logger.debug(
+                        "ファイルでもディレクトリでもないためスキップしました: %s", entry.path
+                    )
+
+            self._add_counts(result, 'files', file_futures)
+            self._add_counts(result, 'dirs', dir_futures)
+
+        return result, cacheable, next_due
+
+    def _clean_subdirectory(
+        self,
+        path: str,
+        executor: ThreadPoolExecutor,
+        dir_futures: list[Future[bool]],
+        result: dict[str, int]
+    ) -> None:
+        """直下のサブディレクトリを削除するか、配下を再帰的にクリーンアップする"""
+        if self.delete_all_extensions:
+            dir_futures.append(executor.submit(self._delete_directory, path))
+            return
+
+        # 特定の拡張子のみ対象の場合はサブディレクトリも再帰的に処理
+        for key, value in self._clean_directory_recursive(path, executor).items():
+            result[key] += value
+
+    def _make_cache_entry(
+        self, directory: str, next_due: float, scan_start: float
+    ) -> dict[str, Any] | None:
+        """クリーンアップ後のディレクトリの状態からスキャンキャッシュの記録を作成"""
+        # 削除による更新の後に取得し、以降の追加は更新日時の変化で検知する
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
 
-        return result
+        # 走査中に追加されて見落としたファイルがあっても、削除期限を迎える前に再走査させる
+        return {
+            'mtime_ns': mtime_ns,
+            'next_due': min(next_due, scan_start),
+            'extensions': sorted(self._target_ext_set)
+        }
 
-    def _clean_directory_recursive(self, directory: Path) -> dict[str, int]:
+    @staticmethod
+    def _make_result(
+        deleted_files: int = 0,
+        deleted_dirs: int = 0,
+        failed_files: int = 0,
+        failed_dirs: int = 0,
+        skipped_files: int = 0
+    ) -> dict[str, int]:
+        """集計値から削除結果の統計情報を作成"""
+        return {
+            'deleted_files': deleted_files,
+            'deleted_dirs': deleted_dirs,
+            'failed_files': failed_files,
+            'failed_dirs': failed_dirs,
+            'skipped_files': skipped_files
+        }
+
+    @staticmethod
+    def _count_results(futures: list[Future[bool]]) -> tuple[int, int]:
+        """削除タスクの結果を成功数と失敗数に集計"""
+        succeeded = sum(1 for future in futures if future.result())
+        return succeeded, len(futures) - succeeded
+
+    @classmethod
+    def _add_counts(
+        cls, result: dict[str, int], kind: str, futures: list[Future[bool]]
+    ) -> None:
+        """削除タスクの結果を統計情報の成功数と失敗数に加算"""
+        deleted, failed = cls._count_results(futures)
+        result[f'deleted_{kind}'] += deleted
+        result[f'failed_{kind}'] += failed
+
+    def _clean_directory_recursive(
+        self,
+        directory: str | Path,
+        executor: ThreadPoolExecutor | None = None
+    ) -> dict[str, int]:
         """
-        ディレクトリを再帰的にクリーンアップ
+        ディレクトリ配下を反復的に走査してクリーンアップし、空になったディレクトリを削除
 
         Args:
             directory: クリーンアップ対象のディレクトリ
+            executor: ファイル削除を並列実行するスレッドプール。省略時は新たに作成する
 
         Returns:
             削除結果の統計情報
         """
-        result = {
-            'deleted_files': 0,
-            'deleted_dirs': 0,
-            'failed_files': 0,
-            'failed_dirs': 0,
-            'skipped_files': 0
-        }
-
-        for item in directory.iterdir():
-            if item.is_file():
-                if self._should_delete_file(item):
-                    if self._delete_file(item):
-                        result['deleted_files'] += 1
-                    else:
-                        result['failed_files'] += 1
-                else:
-                    result['skipped_files'] += 1
+        deleted_files = failed_files = skipped_files = deleted_dirs = failed_dirs = 0
+        # (ディレクトリ, 子の処理が完了したか) を積み、子の後に親を後処理する
+        stack: list[tuple[str | Path, bool]] = [(directory, False)]
+        pending_deletes: dict[str | Path, list[Future[bool]]] = {}
+        # 大量のエントリを処理するループ内での属性参照を避けるためローカル変数に束縛する
+        should_delete = self._make_classifier()
+        delete_file = self._delete_file
+        push = stack.append
+
+        executor_cm = (
+            ThreadPoolExecutor(max_workers=self.threads) if executor is None
+            else nullcontext(executor)
+        )
+        with executor_cm as pool:
+            submit = pool.submit
+            while stack:
+                current_dir, children_done = stack.pop()
+                if children_done:
+                    # 空ディレクトリ判定の前に、このディレクトリ内のファイル削除完了を待つ
+                    deleted, failed = self._count_results(pending_deletes.pop(current_dir))
+                    deleted_files += deleted
+                    failed_files += failed
+                    removed = self._delete_empty_directory(current_dir)
+                    if removed:
+                        deleted_dirs += 1
+                    elif removed is False:
+                        failed_dirs += 1
+                    continue
+
+                try:
+                    it = os.scandir(current_dir)
+                except FileNotFoundError:
+                    # 重なり合う対象ディレクトリの処理などで既に削除されている
+                    self.logger.debug("ディレクトリは既に存在しません: %s", current_dir)
+                    continue
+
+                push((current_dir, True))
+                file_futures = pending_deletes[current_dir] = []
+                add_future = file_futures.append
+                with it:
+                    for entry in it:
+                        if entry.is_file(follow_symlinks=False):
+                            if should_delete(entry):
+                                add_future(submit(delete_file, entry.path))
+                            else:
+                                skipped_files += 1
+                        elif entry.is_dir(follow_symlinks=False):
+                            push((entry.path, False))
+                        else:
+                            skipped_files += 1
+
+        return self._make_result(
+            deleted_files, deleted_dirs, failed_files, failed_dirs, skipped_files
+        )
 
-            elif item.is_dir():
-                sub_result = self._clean_directory_recursive(item)
-                result['deleted_files'] += sub_result['deleted_files']
-                result['failed_files'] += sub_result['failed_files']
-                result['skipped_files'] += sub_result['skipped_files']
-                result['deleted_dirs'] += sub_result['deleted_dirs']
-                result['failed_dirs'] += sub_result['failed_dirs']
+    def _delete_empty_directory(self, dir_path: str | Path) -> bool | None:
+        """
+        空のディレクトリを削除し、空でない場合は何もしない
 
+        Returns:
+            削除した場合はTrue、削除に失敗した場合はFalse、
+            空でないため残した場合や既に存在しない場合はNone
+        """
         try:
-            if not any(directory.iterdir()):
-                directory.rmdir()
-                self.logger.info(f"空のディレクトリを削除しました: {directory}")
-                result['deleted_dirs'] += 1
-        except OSError:
-            self.logger.debug(f"ディレクトリは空ではないため削除しませんでした: {directory}")
-
-        return result
+            os.rmdir(dir_path)
+            self.logger.info("空のディレクトリを削除しました: %s", dir_path)
+            return True
+        except OSError as e:
+            # 空かどうかの判定はrmdirに任せ、空でない場合のエラーは想定内として扱う
+            if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                self.logger.debug("ディレクトリは空ではないため削除しませんでした: %s", dir_path)
+                return None
+            if e.errno == errno.ENOENT:
+                self.logger.debug("ディレクトリは既に存在しません: %s", dir_path)
+                return None
+            self.logger.warning(
+                "空のディレクトリの削除中にエラーが発生しました: %s - %s", dir_path, e
+            )
+            return False
 
     def clean_all(self) -> dict[str, dict[str, int]]:
         """
@@ -257,32 +499,141 @@ class FileCleaner:
             self.logger.warning("対象ディレクトリが設定されていません")
             return results
 
+        scan_cache = load_cache() if self.scan_cache else {}
+        target_dirs: list[str] = []
         for directory in self.target_dirs:
-            self.logger.info(f"処理中: {directory}")
-            results[directory] = self.clean_directory(directory)
+            if self._is_unchanged_since_last_scan(directory, scan_cache):
+                self.logger.info("前回から変更がないためスキップします: %s", directory)
+                results[directory] = self._make_result()
+            else:
+                target_dirs.append(directory)
+
+        if target_dirs:
+            groups = self._group_overlapping_dirs(target_dirs)
+            with self._directory_executor(len(groups)) as executor:
+                futures: list[Future[list[tuple[dict[str, int], dict[str, Any] | None]]]] = []
+                for group in groups:
+                    self.logger.info("処理中: %s", ', '.join(group))
+                    futures.append(executor.submit(self._clean_directories_tracked, group))
+                for group, future in zip(groups, futures):
+                    for directory, (result, cache_entry) in zip(group, future.result()):
+                        results[directory] = result
+                        scan_cache.pop(directory, None)
+                        if cache_entry is not None:
+                            scan_cache[directory] = cache_entry
+
+        if self.scan_cache:
+            save_cache(scan_cache)
+
+        return {directory: results[directory] for directory in self.target_dirs}
+
+    def _clean_directories_tracked(
+        self, directories: list[str]
+    ) -> list[tuple[dict[str, int], dict[str, Any] | None]]:
+        """複数のディレクトリを順番にクリーンアップし、それぞれの結果を返す"""
+        return [self._clean_directory_tracked(directory) for directory in directories]
+
+    @staticmethod
+    def _group_overlapping_dirs(directories: list[str]) -> list[list[str]]:
+        """
+        一方が他方の配下にある対象ディレクトリを同じグループにまとめる
+
+        同じグループのディレクトリは並列に処理すると互いの削除が競合するため、
+        配下のディレクトリから順に直列で処理する
+        """
+        def normalize(directory: str) -> str:
+            return os.path.normcase(os.path.abspath(directory))
+
+        def overlaps(a: str, b: str) -> bool:
+            try:
+                return os.path.commonpath([a, b]) in (a, b)
+            except ValueError:
+                # Windowsで異なるドライブのパスは重ならない
+                return False
+
+        groups: list[list[str]] = []
+        for directory in directories:
+            key = normalize(directory)
+            merged = [directory]
+            remaining: list[list[str]] = []
+            for group in groups:
+                if any(overlaps(key, normalize(member)) for member in group):
+                    merged = group + merged
+                else:
+                    remaining.append(group)
+            groups = remaining + [merged]
+
+        # 配下のディレクトリを先に処理し、親ディレクトリの走査対象を減らす
+        return [
+            sorted(group, key=lambda d: normalize(d).count(os.sep), reverse=True)
+            for group in groups
+        ]
+
+    @contextmanager
+    def _directory_executor(self, dir_count: int) -> Iterator[Executor]:
+        """対象ディレクトリを並列処理するためのExecutorを作成"""
+        if not (self.parallel_dirs and dir_count > 1):
+            # 削除処理はI/O待ちが中心のため、スレッドでもディレクトリ間の待ち時間を重ねられる
+            with ThreadPoolExecutor(max_workers=min(8, dir_count)) as executor:
+                yield executor
+            return
+
+        root_logger = logging.getLogger()
+        log_queue: "Queue[logging.LogRecord]" = multiprocessing.Queue()
+        listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+        listener.start()
+        try:
+            # FileCleaner自体をpickleして渡すため、全プロセスで同じ基準時刻が使われる
+            with ProcessPoolExecutor(
+                max_workers=min(dir_count, os.cpu_count() or 1),
+                initializer=_init_worker_logging,
+                initargs=(log_queue, root_logger.level)
+            ) as executor:
+                yield executor
+        finally:
+            listener.stop()
+
+    def _is_unchanged_since_last_scan(
+        self, directory: str, scan_cache: dict[str, dict[str, Any]]
+    ) -> bool:
+        """前回のクリーンアップ以降に削除対象が増えていないかを判定"""
+        cached = scan_cache.get(directory)
+        if not cached or cached.get('extensions') != sorted(self._target_ext_set):
+            return False
+
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return False
 
-        return results
+        # ディレクトリの更新日時は直下のエントリの追加・削除で更新される
+        return (
+            mtime_ns == cached.get('mtime_ns')
+            and cached.get('next_due', -math.inf) >= self._cutoff_ts
+        )
 
     def print_summary(self, results: dict[str, dict[str, int]]) -> None:
         """クリーンアップ結果のサマリを出力"""
-        total_deleted_files = 0
-        total_deleted_dirs = 0
-        total_failed_files = 0
-        total_failed_dirs = 0
-        total_skipped_files = 0
-
-        for _, result in results.items():
-            total_deleted_files += result['deleted_files']
-            total_deleted_dirs += result['deleted_dirs']
-            total_failed_files += result['failed_files']
-            total_failed_dirs += result['failed_dirs']
-            total_skipped_files += result['skipped_files']
-
-        print("\n" + "-" * 60)
-        print("合計:")
-        print(f"  削除したファイル: {total_deleted_files}")
-        print(f"  削除したフォルダ: {total_deleted_dirs}")
-        print(f"  スキップしたファイル: {total_skipped_files}")
-        print(f"  失敗したファイル: {total_failed_files}")
-        print(f"  失敗したフォルダ: {total_failed_dirs}")
-        print("=" * 60)
+        get_counts = itemgetter(
+            'deleted_files', 'deleted_dirs', 'failed_files', 'failed_dirs', 'skipped_files'
+        )
+        totals = [sum(column) for column in zip(*map(get_counts, results.values()))]
+        (
+            total_deleted_files,
+            total_deleted_dirs,
+            total_failed_files,
+            total_failed_dirs,
+            total_skipped_files,
+        ) = totals or [0] * 5
+
+        summary_lines = [
+            "\n" + "-" * 60,
+            "合計:",
+            f"  削除したファイル: {total_deleted_files}",
+            f"  削除したフォルダ: {total_deleted_dirs}",
+            f"  スキップしたファイル: {total_skipped_files}",
+            f"  失敗したファイル: {total_failed_files}",
+            f"  失敗したフォルダ: {total_failed_dirs}",
+            "=" * 60
+        ]
+        print("\n".join(summary_lines))
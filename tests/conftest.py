@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+_SHM_DIR = '/dev/shm'
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """RAM上の/dev/shmが使える環境ではtmp_pathの作成先をそこに切り替えてディスクI/Oを避ける"""
+    if (
+        config.option.basetemp
+        or os.environ.get('TMPDIR')
+        or os.environ.get('PYTEST_DEBUG_TEMPROOT')
+        or os.name == 'nt'
+    ):
+        return
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK | os.X_OK):
+        # basetempを固定すると実行ごとに削除されるため、一時ディレクトリのルートだけを変更する
+        os.environ['PYTEST_DEBUG_TEMPROOT'] = _SHM_DIR
@@ -0,0 +1,66 @@
+import io
+import os
+
+import pytest
+
+from utils import config_manager
+from utils.config_manager import clear_config_cache, load_config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """一時的な設定ファイルをCONFIG_PATHとして使用する"""
+    path = tmp_path / "config.ini"
+    path.write_text(
+        "[DEFAULT]\nbase = C:\\Users\\test\n\n"
+        "[Paths]\ntarget_dir1 = %(base)s\\Downloads\n\n"
+        "[Settings]\nfile_cleanup_hour = 24\n",
+        encoding='utf-8'
+    )
+    monkeypatch.setattr(config_manager, 'CONFIG_PATH', str(path))
+    clear_config_cache()
+    yield path
+    clear_config_cache()
+
+
+class TestLoadConfig:
+    """設定ファイル読み込みのキャッシュに関するテスト"""
+
+    def test_load_config_returns_independent_objects(self, config_file):
+        """キャッシュ済みでも呼び出しごとに独立したオブジェクトが返されることを確認"""
+        first = load_config()
+        first.set('Settings', 'file_cleanup_hour', '1')
+        second = load_config()
+
+        assert first is not second
+        assert second.get('Settings', 'file_cleanup_hour') == '24'
+
+    def test_load_config_uses_cache(self, config_file):
+        """ファイルが更新されていない場合、再解析されないことを確認"""
+        load_config()
+        load_config()
+
+        info = config_manager._read_config_data.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_load_config_reloads_on_mtime_change(self, config_file):
+        """ファイルの更新日時が変わった場合、再読み込みされることを確認"""
+        assert load_config().get('Settings', 'file_cleanup_hour') == '24'
+
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        config_file.write_text("[Settings]\nfile_cleanup_hour = 48\n", encoding='utf-8')
+        os.utime(config_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        assert load_config().get('Settings', 'file_cleanup_hour') == '48'
+
+    def test_load_config_keeps_defaults_and_interpolation(self, config_file):
+        """DEFAULTセクションと補間がキャッシュ経由でも保持されることを確認"""
+        config = load_config()
+
+        assert config.defaults() == {'base': 'C:\\Users\\test'}
+        assert config.get('Paths', 'target_dir1') == 'C:\\Users\\test\\Downloads'
+
+        output = io.StringIO()
+        config.write(output)
+        assert output.getvalue().count('base =') == 1
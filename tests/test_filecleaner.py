@@ -1,7 +1,9 @@
 import configparser
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
@@ -10,7 +12,7 @@ import pytest
 from service.filecleaner import FileCleaner
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     """テスト用のConfigParserオブジェクトを作成"""
     config = configparser.ConfigParser()
@@ -23,12 +25,30 @@ def mock_config():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def file_cleaner(mock_config):
-    """FileCleaner インスタンスを作成"""
+    """FileCleaner インスタンスを作成（モジュール内で共有するため変更しないこと）"""
     return FileCleaner(config=mock_config)
 
 
+@pytest.fixture
+def age_file(file_cleaner):
+    """ファイルの更新日時をFileCleaner起動時刻の指定時間前に設定する関数を返す"""
+    def _set(path, hours):
+        timestamp = file_cleaner._app_start_ts - hours * 3600
+        os.utime(path, (timestamp, timestamp))
+    return _set
+
+
+@pytest.fixture
+def fake_stat(file_cleaner):
+    """Path.statがFileCleaner起動時刻の指定時間前の更新日時を返すようにパッチする関数を返す"""
+    def _patch(hours):
+        mtime = file_cleaner._app_start_ts - hours * 3600
+        return patch.object(Path, 'stat', return_value=SimpleNamespace(st_mtime=mtime))
+    return _patch
+
+
 @pytest.fixture
 def mock_logger():
     """モックロガーを作成"""
@@ -57,19 +77,24 @@ class TestFileCleanerInit:
         mock_load_config.assert_called_once()
         assert cleaner.config == mock_config
 
-    def test_init_loads_target_directories(self, file_cleaner):
-        """初期化時に対象ディレクトリが読み込まれることを確認"""
-        assert len(file_cleaner.target_dirs) == 2
-        assert 'C:\\Users\\test\\Downloads' in file_cleaner.target_dirs
-        assert 'C:\\Users\\test\\Documents' in file_cleaner.target_dirs
-
-    def test_init_loads_target_extensions(self, file_cleaner):
-        """初期化時に対象拡張子が読み込まれることを確認"""
-        assert file_cleaner.target_extensions == ['pdf', 'txt', 'jpg']
-
-    def test_init_loads_cleanup_hour(self, file_cleaner):
-        """初期化時にクリーンアップ時間が読み込まれることを確認"""
-        assert file_cleaner.file_cleanup_hour == 24
+    @pytest.mark.parametrize('attr, expected', [
+        ('target_dirs', {'C:\\Users\\test\\Downloads', 'C:\\Users\\test\\Documents'}),
+        ('target_extensions', ['pdf', 'txt', 'jpg']),
+        ('file_cleanup_hour', 24),
+    ])
+    def test_init_loads_settings(self, file_cleaner, attr, expected):
+        """初期化時に対象ディレクトリ・拡張子・クリーンアップ時間が読み込まれることを確認"""
+        value = getattr(file_cleaner, attr)
+        if isinstance(expected, set):
+            assert len(value) == len(expected)
+            value = set(value)
+        assert value == expected
+
+    def test_init_precomputes_cutoff(self, file_cleaner):
+        """初期化時に基準時刻のタイムスタンプが一度だけ計算されることを確認"""
+        expected = (file_cleaner.app_start_time - timedelta(hours=24)).timestamp()
+        assert file_cleaner._cutoff_ts == pytest.approx(expected)
+        assert file_cleaner.app_start_time.timestamp() == pytest.approx(file_cleaner._app_start_ts)
 
 
 class TestLoadSettings:
@@ -85,6 +110,7 @@ class TestLoadSettings:
 
         cleaner = FileCleaner(config=config)
         assert cleaner.target_extensions == ['*']
+        assert cleaner.delete_all_extensions is True
 
     def test_load_settings_multiple_extensions(self):
         """複数の拡張子が正しく読み込まれることを確認"""
@@ -96,6 +122,18 @@ class TestLoadSettings:
 
         cleaner = FileCleaner(config=config)
         assert cleaner.target_extensions == ['pdf', 'txt', 'jpg']
+        assert cleaner.delete_all_extensions is False
+
+    def test_load_settings_wildcard_in_list(self):
+        """拡張子リストに*が含まれる場合、全ファイルが対象になることを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', 'pdf, *')
+
+        cleaner = FileCleaner(config=config)
+        assert cleaner.delete_all_extensions is True
+        assert cleaner._matches_extension("noextension") is True
 
     def test_load_settings_invalid_cleanup_hour(self):
         """不正なクリーンアップ時間の場合、デフォルト値が使用されることを確認"""
@@ -119,6 +157,46 @@ class TestLoadSettings:
         cleaner = FileCleaner(config=config)
         assert cleaner.target_extensions == []
 
+    def test_load_settings_dot_only_extension_ignored(self):
+        """ドットのみの要素は拡張子として扱われないことを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', 'pdf, ., ..')
+
+        cleaner = FileCleaner(config=config)
+        assert cleaner.target_extensions == ['pdf']
+
+    def test_load_settings_threads(self):
+        """スレッド数が読み込まれ、不正な値の場合はデフォルト値が使用されることを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.add_section('Settings')
+        config.set('Settings', 'threads', '4')
+        assert FileCleaner(config=config).threads == 4
+
+        config.set('Settings', 'threads', 'invalid')
+        assert FileCleaner(config=config).threads == 8
+
+        config.set('Settings', 'threads', '0')
+        assert FileCleaner(config=config).threads == 1
+
+    def test_load_settings_invalid_bool_flags(self, caplog):
+        """真偽値の設定が不正な場合、警告を出してデフォルト値が使用されることを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.add_section('Settings')
+        config.set('Settings', 'parallel_dirs', 'maybe')
+        config.set('Settings', 'scan_cache', 'sometimes')
+
+        with caplog.at_level(logging.WARNING, logger='service.filecleaner'):
+            cleaner = FileCleaner(config=config)
+
+        assert cleaner.parallel_dirs is False
+        assert cleaner.scan_cache is False
+        assert "parallel_dirs の値が不正です: maybe" in caplog.text
+        assert "scan_cache の値が不正です: sometimes" in caplog.text
+
 
 class TestGetTargetDirectories:
     """対象ディレクトリ取得に関するテスト"""
@@ -175,42 +253,37 @@ class TestGetTargetDirectories:
 class TestIsFileOldEnough:
     """ファイル年齢判定に関するテスト"""
 
-    def test_is_file_old_enough_old_file(self, file_cleaner, tmp_path):
+    def test_is_file_old_enough_old_file(self, file_cleaner, fake_stat):
         """古いファイルがTrueを返すことを確認"""
-        test_file = tmp_path / "old_file.txt"
-        test_file.write_text("test")
+        with fake_stat(25):
+            assert file_cleaner._is_file_old_enough(Path("old_file.txt")) is True
 
-        # ファイルの更新時刻を25時間前に設定
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        test_file.touch()
-        import os
-        os.utime(test_file, (old_time, old_time))
+    def test_is_file_old_enough_recent_file(self, file_cleaner, fake_stat):
+        """新しいファイルがFalseを返すことを確認"""
+        with fake_stat(1):
+            assert file_cleaner._is_file_old_enough(Path("recent_file.txt")) is False
 
-        assert file_cleaner._is_file_old_enough(test_file) is True
+    def test_is_file_old_enough_exact_cutoff_time(self, file_cleaner, fake_stat):
+        """カットオフ時刻ちょうどのファイルがFalseを返すことを確認"""
+        with fake_stat(24):
+            assert file_cleaner._is_file_old_enough(Path("exact_file.txt")) is False
 
-    def test_is_file_old_enough_recent_file(self, file_cleaner, tmp_path):
-        """新しいファイルがFalseを返すことを確認"""
-        test_file = tmp_path / "recent_file.txt"
+    def test_is_file_old_enough_str_path(self, file_cleaner, tmp_path, age_file):
+        """実ファイルの文字列パスでも判定できることを確認"""
+        test_file = tmp_path / "old_file.txt"
         test_file.write_text("test")
+        age_file(test_file, 25)
 
-        # ファイルの更新時刻を1時間前に設定
-        recent_time = (file_cleaner.app_start_time - timedelta(hours=1)).timestamp()
-        import os
-        os.utime(test_file, (recent_time, recent_time))
+        assert file_cleaner._is_file_old_enough(str(test_file)) is True
 
-        assert file_cleaner._is_file_old_enough(test_file) is False
+    def test_is_file_old_enough_debug_log(self, file_cleaner, fake_stat, caplog):
+        """デバッグログに日本時間の更新日時が出力されることを確認"""
+        old_time = file_cleaner.app_start_time - timedelta(hours=25)
 
-    def test_is_file_old_enough_exact_cutoff_time(self, file_cleaner, tmp_path):
-        """カットオフ時刻ちょうどのファイルがFalseを返すことを確認"""
-        test_file = tmp_path / "exact_file.txt"
-        test_file.write_text("test")
+        with fake_stat(25), caplog.at_level(logging.DEBUG, logger='service.filecleaner'):
+            file_cleaner._is_file_old_enough(Path("old_file.txt"))
 
-        # ファイルの更新時刻をちょうど24時間前に設定
-        cutoff_time = (file_cleaner.app_start_time - timedelta(hours=24)).timestamp()
-        import os
-        os.utime(test_file, (cutoff_time, cutoff_time))
-
-        assert file_cleaner._is_file_old_enough(test_file) is False
+        assert f"更新日時: {old_time.strftime('%Y-%m-%d %H:%M:%S')}" in caplog.text
 
     def test_is_file_old_enough_oserror(self, file_cleaner):
         """OSErrorが発生した場合、Falseを返すことを確認"""
@@ -221,7 +294,7 @@ class TestIsFileOldEnough:
 class TestShouldDeleteFile:
     """ファイル削除判定に関するテスト"""
 
-    def test_should_delete_file_wildcard_match_old(self, tmp_path):
+    def test_should_delete_file_wildcard_match_old(self, tmp_path, age_file):
         """ワイルドカード設定で古いファイルがTrueを返すことを確認"""
         config = configparser.ConfigParser()
         config.add_section('Paths')
@@ -232,52 +305,99 @@ class TestShouldDeleteFile:
 
         test_file = tmp_path / "any_file.xyz"
         test_file.write_text("test")
-        old_time = (cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         assert cleaner._should_delete_file(test_file) is True
 
-    def test_should_delete_file_extension_match_old(self, file_cleaner, tmp_path):
+    def test_should_delete_file_wildcard_without_retention(self, tmp_path):
+        """ワイルドカードかつ保持期間0の場合、statを呼ばずにTrueを返すことを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', '*')
+        config.set('Settings', 'file_cleanup_hour', '0')
+        cleaner = FileCleaner(config=config)
+
+        test_file = tmp_path / "any_file.xyz"
+        test_file.write_text("test")
+
+        with patch.object(Path, 'stat') as mock_stat:
+            assert cleaner._should_delete_file(test_file) is True
+            mock_stat.assert_not_called()
+
+    def test_should_delete_file_stats_at_most_once(self, file_cleaner):
+        """拡張子が一致する場合のみ、statが1回だけ呼ばれることを確認"""
+        old_mtime = file_cleaner._cutoff_ts - 3600
+        matching = MagicMock(spec=os.DirEntry, path="old.pdf")
+        matching.name = "old.pdf"
+        matching.stat.return_value = MagicMock(st_mtime=old_mtime)
+        not_matching = MagicMock(spec=os.DirEntry, path="old.docx")
+        not_matching.name = "old.docx"
+
+        assert file_cleaner._should_delete_file(matching) is True
+        assert file_cleaner._should_delete_file(not_matching) is False
+        matching.stat.assert_called_once_with(follow_symlinks=False)
+        not_matching.stat.assert_not_called()
+
+    def test_should_delete_file_extension_match_old(self, file_cleaner, tmp_path, age_file):
         """拡張子が一致し、古いファイルがTrueを返すことを確認"""
         test_file = tmp_path / "old_document.pdf"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         assert file_cleaner._should_delete_file(test_file) is True
 
-    def test_should_delete_file_extension_match_recent(self, file_cleaner, tmp_path):
+    def test_should_delete_file_extension_match_recent(self, file_cleaner, tmp_path, age_file):
         """拡張子が一致しても、新しいファイルはFalseを返すことを確認"""
         test_file = tmp_path / "recent_document.pdf"
         test_file.write_text("test")
-        recent_time = (file_cleaner.app_start_time - timedelta(hours=1)).timestamp()
-        import os
-        os.utime(test_file, (recent_time, recent_time))
+        age_file(test_file, 1)
 
         assert file_cleaner._should_delete_file(test_file) is False
 
-    def test_should_delete_file_extension_not_match(self, file_cleaner, tmp_path):
+    def test_should_delete_file_extension_not_match(self, file_cleaner, tmp_path, age_file):
         """拡張子が一致しないファイルはFalseを返すことを確認"""
         test_file = tmp_path / "document.docx"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         assert file_cleaner._should_delete_file(test_file) is False
 
-    def test_should_delete_file_case_insensitive(self, file_cleaner, tmp_path):
+    def test_should_delete_file_case_insensitive(self, file_cleaner, tmp_path, age_file):
         """拡張子の大文字小文字を区別しないことを確認"""
         test_file = tmp_path / "document.PDF"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         assert file_cleaner._should_delete_file(test_file) is True
 
+    @pytest.mark.parametrize('extensions', ['pdf,txt', '*'])
+    def test_make_classifier_matches_should_delete_file(self, tmp_path, age_file, extensions):
+        """設定値を束縛した判定関数が汎用の判定処理と同じ結果を返すことを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', extensions)
+        config.set('Settings', 'file_cleanup_hour', '24')
+        cleaner = FileCleaner(config=config)
+
+        for name, hours in [
+            ("old.pdf", 25), ("new.PDF", 1), ("old.docx", 25), ("noext", 25), (".pdf", 25)
+        ]:
+            test_file = tmp_path / name
+            test_file.write_text("test")
+            age_file(test_file, hours)
+
+        classify = cleaner._make_classifier()
+        with os.scandir(tmp_path) as it:
+            for entry in it:
+                assert classify(entry) is cleaner._should_delete_file(entry), entry.name
+
+    def test_make_classifier_debug_uses_should_delete_file(self, file_cleaner):
+        """デバッグログ有効時は判定ごとにログを出力する汎用の判定処理が使われることを確認"""
+        with patch.object(file_cleaner.logger, 'isEnabledFor', return_value=True):
+            assert file_cleaner._make_classifier() == file_cleaner._should_delete_file
+
 
 class TestDeleteFile:
     """ファイル削除に関するテスト"""
@@ -297,7 +417,7 @@ class TestDeleteFile:
 
         assert file_cleaner._delete_file(test_file) is False
 
-    @patch('pathlib.Path.unlink')
+    @patch('service.filecleaner.os.unlink')
     def test_delete_file_permission_error(self, mock_unlink, file_cleaner, tmp_path):
         """PermissionErrorが発生した場合、Falseを返すことを確認"""
         mock_unlink.side_effect = PermissionError("Access denied")
@@ -305,7 +425,7 @@ class TestDeleteFile:
 
         assert file_cleaner._delete_file(test_file) is False
 
-    @patch('pathlib.Path.unlink')
+    @patch('service.filecleaner.os.unlink')
     def test_delete_file_os_error(self, mock_unlink, file_cleaner, tmp_path):
         """OSErrorが発生した場合、Falseを返すことを確認"""
         mock_unlink.side_effect = OSError("Disk error")
@@ -313,6 +433,14 @@ class TestDeleteFile:
 
         assert file_cleaner._delete_file(test_file) is False
 
+    def test_delete_file_str_path(self, file_cleaner, tmp_path):
+        """文字列のパスでもファイルを削除できることを確認"""
+        test_file = tmp_path / "delete_me.txt"
+        test_file.write_text("test")
+
+        assert file_cleaner._delete_file(str(test_file)) is True
+        assert not test_file.exists()
+
 
 class TestDeleteDirectory:
     """ディレクトリ削除に関するテスト"""
@@ -343,19 +471,58 @@ class TestDeleteDirectory:
 
         assert file_cleaner._delete_directory(test_dir) is False
 
+    def test_delete_empty_directory_uses_rmdir(self, file_cleaner, tmp_path):
+        """空のディレクトリはrmtreeを使わずに削除され、空でない場合は残ることを確認"""
+        empty_dir = tmp_path / "empty"
+        empty_dir.mkdir()
+        non_empty_dir = tmp_path / "non_empty"
+        non_empty_dir.mkdir()
+        (non_empty_dir / "file.txt").write_text("test")
+
+        with patch('service.filecleaner.shutil.rmtree') as mock_rmtree:
+            assert file_cleaner._delete_empty_directory(str(empty_dir)) is True
+            assert file_cleaner._delete_empty_directory(str(non_empty_dir)) is None
+            mock_rmtree.assert_not_called()
+
+        assert not empty_dir.exists()
+        assert (non_empty_dir / "file.txt").exists()
+
 
 class TestCleanDirectory:
     """ディレクトリクリーンアップに関するテスト"""
 
-    def test_clean_directory_nonexistent(self, file_cleaner):
+    def test_clean_directory_nonexistent(self, mock_config):
         """存在しないディレクトリの処理結果を確認"""
-        result = file_cleaner.clean_directory("C:\\nonexistent_dir")
+        cleaner = FileCleaner(config=mock_config)
+        result = cleaner.clean_directory("C:\\nonexistent_dir")
         assert result['deleted_files'] == 0
         assert result['deleted_dirs'] == 0
         assert result['failed_files'] == 0
         assert result['failed_dirs'] == 0
         assert result['skipped_files'] == 0
 
+    def test_clean_directory_symlink_skipped(self, file_cleaner, tmp_path, age_file):
+        """シンボリックリンクは削除されず、スキップとして集計されることを確認"""
+        test_dir = tmp_path / "clean_dir"
+        sub_dir = test_dir / "subdir"
+        sub_dir.mkdir(parents=True)
+        target = tmp_path / "target.pdf"
+        target.write_text("test")
+        age_file(target, 25)
+        try:
+            (test_dir / "link.pdf").symlink_to(target)
+            (sub_dir / "link.pdf").symlink_to(target)
+        except OSError:
+            pytest.skip("シンボリックリンクを作成できない環境")
+
+        result = file_cleaner.clean_directory(str(test_dir))
+
+        assert result['skipped_files'] == 2
+        assert result['deleted_files'] == 0
+        assert (test_dir / "link.pdf").is_symlink()
+        assert (sub_dir / "link.pdf").is_symlink()
+        assert target.exists()
+
     def test_clean_directory_not_a_directory(self, file_cleaner, tmp_path):
         """ディレクトリでないパスの処理結果を確認"""
         test_file = tmp_path / "not_a_dir.txt"
@@ -385,21 +552,18 @@ class TestCleanDirectory:
         assert result['deleted_dirs'] == 1
         assert not subdir.exists()
 
-    def test_clean_directory_deletes_old_files(self, file_cleaner, tmp_path):
+    def test_clean_directory_deletes_old_files(self, file_cleaner, tmp_path, age_file):
         """古いファイルが削除されることを確認"""
         test_dir = tmp_path / "test_cleanup"
         test_dir.mkdir()
 
         old_file = test_dir / "old.pdf"
         old_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(old_file, (old_time, old_time))
+        age_file(old_file, 25)
 
         recent_file = test_dir / "recent.pdf"
         recent_file.write_text("test")
-        recent_time = (file_cleaner.app_start_time - timedelta(hours=1)).timestamp()
-        os.utime(recent_file, (recent_time, recent_time))
+        age_file(recent_file, 1)
 
         result = file_cleaner.clean_directory(str(test_dir))
         assert result['deleted_files'] == 1
@@ -407,23 +571,21 @@ class TestCleanDirectory:
         assert not old_file.exists()
         assert recent_file.exists()
 
-    def test_clean_directory_skips_wrong_extension(self, file_cleaner, tmp_path):
+    def test_clean_directory_skips_wrong_extension(self, file_cleaner, tmp_path, age_file):
         """拡張子が一致しないファイルがスキップされることを確認"""
         test_dir = tmp_path / "test_cleanup"
         test_dir.mkdir()
 
         wrong_ext_file = test_dir / "file.docx"
         wrong_ext_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(wrong_ext_file, (old_time, old_time))
+        age_file(wrong_ext_file, 25)
 
         result = file_cleaner.clean_directory(str(test_dir))
         assert result['deleted_files'] == 0
         assert result['skipped_files'] == 1
         assert wrong_ext_file.exists()
 
-    def test_clean_directory_recursive_with_extensions(self, file_cleaner, tmp_path):
+    def test_clean_directory_recursive_with_extensions(self, file_cleaner, tmp_path, age_file):
         """特定拡張子設定でサブディレクトリが再帰的に処理されることを確認"""
         test_dir = tmp_path / "test_cleanup"
         test_dir.mkdir()
@@ -433,9 +595,7 @@ class TestCleanDirectory:
         # サブディレクトリ内の古いファイル
         old_file = subdir / "old.pdf"
         old_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(old_file, (old_time, old_time))
+        age_file(old_file, 25)
 
         result = file_cleaner.clean_directory(str(test_dir))
         assert result['deleted_files'] == 1
@@ -443,16 +603,25 @@ class TestCleanDirectory:
         assert not old_file.exists()
         assert not subdir.exists()
 
-    def test_clean_directory_file_deletion_failure(self, file_cleaner, tmp_path):
+    def test_clean_directory_counts_failed_empty_dir_removal(self, file_cleaner, tmp_path):
+        """空のサブディレクトリの削除に失敗した場合、失敗したフォルダとして集計されることを確認"""
+        test_dir = tmp_path / "test_cleanup"
+        (test_dir / "subdir").mkdir(parents=True)
+
+        with patch('service.filecleaner.os.rmdir', side_effect=PermissionError(13, "Access denied")):
+            result = file_cleaner.clean_directory(str(test_dir))
+
+        assert result['deleted_dirs'] == 0
+        assert result['failed_dirs'] == 1
+
+    def test_clean_directory_file_deletion_failure(self, file_cleaner, tmp_path, age_file):
         """ファイル削除失敗時のカウント増加を確認"""
         test_dir = tmp_path / "test_cleanup"
         test_dir.mkdir()
 
         old_file = test_dir / "old.pdf"
         old_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(old_file, (old_time, old_time))
+        age_file(old_file, 25)
 
         # ファイル削除をモックして失敗させる
         with patch.object(file_cleaner, '_delete_file', return_value=False):
@@ -484,7 +653,7 @@ class TestCleanDirectory:
 class TestCleanDirectoryRecursive:
     """再帰的ディレクトリクリーンアップに関するテスト"""
 
-    def test_clean_directory_recursive_nested_structure(self, file_cleaner, tmp_path):
+    def test_clean_directory_recursive_nested_structure(self, file_cleaner, tmp_path, age_file):
         """ネストしたディレクトリ構造が正しく処理されることを確認"""
         test_dir = tmp_path / "root"
         test_dir.mkdir()
@@ -496,9 +665,7 @@ class TestCleanDirectoryRecursive:
         # 各レベルにファイルを配置
         file1 = level2 / "deep.pdf"
         file1.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(file1, (old_time, old_time))
+        age_file(file1, 25)
 
         result = file_cleaner._clean_directory_recursive(test_dir)
         assert result['deleted_files'] == 1
@@ -507,7 +674,24 @@ class TestCleanDirectoryRecursive:
         assert not level1.exists()
         assert not test_dir.exists()
 
-    def test_clean_directory_recursive_keeps_non_empty_dirs(self, file_cleaner, tmp_path):
+    def test_clean_directory_recursive_does_not_recurse(self, file_cleaner, tmp_path):
+        """ネストしたディレクトリを自己呼び出しせずに処理することを確認"""
+        test_dir = tmp_path / "root"
+        nested = test_dir / "a" / "b" / "c"
+        nested.mkdir(parents=True)
+        (test_dir / "a" / "keep.docx").write_text("test")
+
+        with patch.object(
+            file_cleaner, '_clean_directory_recursive',
+            wraps=file_cleaner._clean_directory_recursive
+        ) as mock_recursive:
+            result = mock_recursive(test_dir)
+            assert mock_recursive.call_count == 1
+
+        assert result['deleted_dirs'] == 2  # b, c が削除される
+        assert (test_dir / "a").exists()
+
+    def test_clean_directory_recursive_keeps_non_empty_dirs(self, file_cleaner, tmp_path, age_file):
         """空でないディレクトリは残されることを確認"""
         test_dir = tmp_path / "root"
         test_dir.mkdir()
@@ -517,9 +701,7 @@ class TestCleanDirectoryRecursive:
         # 新しいファイル（削除されない）
         recent_file = subdir / "recent.pdf"
         recent_file.write_text("test")
-        recent_time = (file_cleaner.app_start_time - timedelta(hours=1)).timestamp()
-        import os
-        os.utime(recent_file, (recent_time, recent_time))
+        age_file(recent_file, 1)
 
         result = file_cleaner._clean_directory_recursive(test_dir)
         assert result['deleted_files'] == 0
@@ -527,7 +709,7 @@ class TestCleanDirectoryRecursive:
         assert subdir.exists()
         assert recent_file.exists()
 
-    def test_clean_directory_recursive_mixed_files(self, file_cleaner, tmp_path):
+    def test_clean_directory_recursive_mixed_files(self, file_cleaner, tmp_path, age_file):
         """削除対象と非対象のファイルが混在する場合の処理を確認"""
         test_dir = tmp_path / "root"
         test_dir.mkdir()
@@ -535,20 +717,17 @@ class TestCleanDirectoryRecursive:
         # 古いPDFファイル（削除される）
         old_pdf = test_dir / "old.pdf"
         old_pdf.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(old_pdf, (old_time, old_time))
+        age_file(old_pdf, 25)
 
         # 新しいPDFファイル（スキップされる）
         recent_pdf = test_dir / "recent.pdf"
         recent_pdf.write_text("test")
-        recent_time = (file_cleaner.app_start_time - timedelta(hours=1)).timestamp()
-        os.utime(recent_pdf, (recent_time, recent_time))
+        age_file(recent_pdf, 1)
 
         # 古いが拡張子が違うファイル（スキップされる）
         old_docx = test_dir / "old.docx"
         old_docx.write_text("test")
-        os.utime(old_docx, (old_time, old_time))
+        age_file(old_docx, 25)
 
         result = file_cleaner._clean_directory_recursive(test_dir)
         assert result['deleted_files'] == 1
@@ -557,16 +736,14 @@ class TestCleanDirectoryRecursive:
         assert recent_pdf.exists()
         assert old_docx.exists()
 
-    def test_clean_directory_recursive_file_deletion_failure(self, file_cleaner, tmp_path):
+    def test_clean_directory_recursive_file_deletion_failure(self, file_cleaner, tmp_path, age_file):
         """再帰処理中のファイル削除失敗時のカウント増加を確認"""
         test_dir = tmp_path / "root"
         test_dir.mkdir()
 
         old_file = test_dir / "old.pdf"
         old_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(old_file, (old_time, old_time))
+        age_file(old_file, 25)
 
         # ファイル削除をモックして失敗させる
         with patch.object(file_cleaner, '_delete_file', return_value=False):
@@ -574,7 +751,7 @@ class TestCleanDirectoryRecursive:
             assert result['failed_files'] == 1
             assert result['deleted_files'] == 0
 
-    def test_clean_directory_recursive_non_empty_dir_not_deleted(self, file_cleaner, tmp_path):
+    def test_clean_directory_recursive_non_empty_dir_not_deleted(self, file_cleaner, tmp_path, age_file):
         """ディレクトリが空でない場合、削除されないことを確認"""
         test_dir = tmp_path / "root"
         test_dir.mkdir()
@@ -582,9 +759,7 @@ class TestCleanDirectoryRecursive:
         # 新しいファイルを配置（削除されない）
         recent_file = test_dir / "recent.pdf"
         recent_file.write_text("test")
-        recent_time = (file_cleaner.app_start_time - timedelta(hours=1)).timestamp()
-        import os
-        os.utime(recent_file, (recent_time, recent_time))
+        age_file(recent_file, 1)
 
         result = file_cleaner._clean_directory_recursive(test_dir)
         # ディレクトリは空でないため削除されない
@@ -592,6 +767,50 @@ class TestCleanDirectoryRecursive:
         assert test_dir.exists()
         assert recent_file.exists()
 
+    def test_clean_directory_recursive_uses_scandir_stat(self, file_cleaner, tmp_path, age_file):
+        """再帰処理ではPath.statを呼ばずにDirEntryの情報で判定することを確認"""
+        test_dir = tmp_path / "root"
+        test_dir.mkdir()
+        old_file = test_dir / "old.pdf"
+        old_file.write_text("test")
+        age_file(old_file, 25)
+
+        with patch.object(Path, 'stat', side_effect=AssertionError("Path.stat called")):
+            result = file_cleaner._clean_directory_recursive(test_dir)
+
+        assert result['deleted_files'] == 1
+        assert not old_file.exists()
+
+    def test_clean_directory_recursive_rmdir_error_logged(self, file_cleaner, tmp_path, caplog):
+        """空でない以外の理由でディレクトリ削除に失敗した場合、警告が出力されることを確認"""
+        test_dir = tmp_path / "root"
+        test_dir.mkdir()
+
+        with patch('service.filecleaner.os.rmdir', side_effect=PermissionError(13, "Access denied")):
+            result = file_cleaner._clean_directory_recursive(test_dir)
+
+        assert result['deleted_dirs'] == 0
+        assert result['failed_dirs'] == 1
+        assert "空のディレクトリの削除中にエラーが発生しました" in caplog.text
+
+    def test_clean_directory_recursive_missing_dir_ignored(self, file_cleaner, tmp_path):
+        """走査中に既に削除されたディレクトリはエラーにならないことを確認"""
+        result = file_cleaner._clean_directory_recursive(tmp_path / "missing")
+
+        assert result['deleted_dirs'] == 0
+        assert result['failed_dirs'] == 0
+
+    def test_clean_directory_recursive_rmdir_enoent_not_failed(self, file_cleaner, tmp_path):
+        """削除しようとしたディレクトリが既に存在しない場合、失敗として数えないことを確認"""
+        test_dir = tmp_path / "root"
+        test_dir.mkdir()
+
+        with patch('service.filecleaner.os.rmdir', side_effect=FileNotFoundError(2, "No such file")):
+            result = file_cleaner._clean_directory_recursive(test_dir)
+
+        assert result['deleted_dirs'] == 0
+        assert result['failed_dirs'] == 0
+
 
 class TestCleanAll:
     """全ディレクトリクリーンアップに関するテスト"""
@@ -606,7 +825,7 @@ class TestCleanAll:
         results = cleaner.clean_all()
         assert results == {}
 
-    def test_clean_all_multiple_directories(self, tmp_path):
+    def test_clean_all_multiple_directories(self, tmp_path, age_file):
         """複数のディレクトリが処理されることを確認"""
         config = configparser.ConfigParser()
         config.add_section('Paths')
@@ -627,10 +846,8 @@ class TestCleanAll:
         file2 = dir2 / "file2.pdf"
         file2.write_text("test")
 
-        old_time = (cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(file1, (old_time, old_time))
-        os.utime(file2, (old_time, old_time))
+        age_file(file1, 25)
+        age_file(file2, 25)
 
         results = cleaner.clean_all()
         assert len(results) == 2
@@ -639,6 +856,167 @@ class TestCleanAll:
         assert results[str(dir1)]['deleted_files'] == 1
         assert results[str(dir2)]['deleted_files'] == 1
 
+    def test_clean_all_parallel_dirs(self, tmp_path, age_file, caplog):
+        """parallel_dirs有効時も各ディレクトリが処理され、ワーカーのログが親プロセスに届くことを確認"""
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        dir1 = tmp_path / "dir1"
+        dir2 = tmp_path / "dir2"
+        dir1.mkdir()
+        dir2.mkdir()
+        config.set('Paths', 'target_dir1', str(dir1))
+        config.set('Paths', 'target_dir2', str(dir2))
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', 'pdf')
+        config.set('Settings', 'file_cleanup_hour', '24')
+        config.set('Settings', 'parallel_dirs', 'True')
+        cleaner = FileCleaner(config=config)
+
+        file1 = dir1 / "file1.pdf"
+        file1.write_text("test")
+        file2 = dir2 / "file2.pdf"
+        file2.write_text("test")
+
+        age_file(file1, 25)
+        age_file(file2, 25)
+
+        with caplog.at_level(logging.INFO):
+            results = cleaner.clean_all()
+        assert results[str(dir1)]['deleted_files'] == 1
+        assert results[str(dir2)]['deleted_files'] == 1
+        assert not file1.exists()
+        assert not file2.exists()
+        assert f"クリーンアップを開始します: {dir1}" in caplog.text
+        assert f"クリーンアップを開始します: {dir2}" in caplog.text
+
+    def test_clean_all_nested_target_dirs(self, tmp_path, age_file):
+        """親子関係にある対象ディレクトリを指定しても競合せずに処理されることを確認"""
+        root = tmp_path / "root"
+        nested = root / "sub"
+        for i in range(200):
+            sub_dir = nested / f"dir{i}"
+            sub_dir.mkdir(parents=True)
+            old_file = sub_dir / "old.pdf"
+            old_file.write_text("test")
+            age_file(old_file, 25)
+
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.set('Paths', 'target_dir1', str(root))
+        config.set('Paths', 'target_dir2', str(nested))
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', 'pdf')
+        config.set('Settings', 'file_cleanup_hour', '24')
+        cleaner = FileCleaner(config=config)
+
+        results = cleaner.clean_all()
+        assert list(results) == [str(root), str(nested)]
+        assert results[str(root)]['deleted_files'] + results[str(nested)]['deleted_files'] == 200
+        assert results[str(root)]['failed_dirs'] == 0
+        assert results[str(nested)]['failed_dirs'] == 0
+        assert list(root.iterdir()) == []
+
+    def test_group_overlapping_dirs(self, tmp_path):
+        """重なり合う対象ディレクトリが配下のものから順に同じグループにまとめられることを確認"""
+        root = str(tmp_path / "root")
+        nested = str(tmp_path / "root" / "sub")
+        sibling = str(tmp_path / "root2")
+
+        groups = FileCleaner._group_overlapping_dirs([root, sibling, nested])
+        assert groups == [[sibling], [nested, root]]
+
+
+class TestScanCache:
+    """スキャンキャッシュによるスキップに関するテスト"""
+
+    @pytest.fixture
+    def cache_config(self, tmp_path, monkeypatch):
+        """キャッシュを有効にした設定を作成"""
+        monkeypatch.setattr('utils.scan_cache.CACHE_PATH', str(tmp_path / "cache.json"))
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        config = configparser.ConfigParser()
+        config.add_section('Paths')
+        config.set('Paths', 'target_dir1', str(target_dir))
+        config.add_section('Settings')
+        config.set('Settings', 'target_extensions', 'pdf')
+        config.set('Settings', 'file_cleanup_hour', '24')
+        config.set('Settings', 'scan_cache', 'True')
+        return config, target_dir
+
+    def test_unchanged_directory_is_skipped(self, cache_config):
+        """変更のないディレクトリは次回スキップされることを確認"""
+        config, target_dir = cache_config
+        (target_dir / "recent.pdf").write_text("test")
+        FileCleaner(config=config).clean_all()
+
+        cleaner = FileCleaner(config=config)
+        with patch.object(cleaner, '_clean_directory_tracked') as mock_clean:
+            results = cleaner.clean_all()
+            mock_clean.assert_not_called()
+        assert results[str(target_dir)]['deleted_files'] == 0
+
+    def test_directory_is_scanned_once(self, cache_config, age_file):
+        """キャッシュ更新のためにクリーンアップ後の再走査を行わないことを確認"""
+        config, target_dir = cache_config
+        old_file = target_dir / "old.pdf"
+        old_file.write_text("test")
+        age_file(old_file, 25)
+        (target_dir / "recent.pdf").write_text("test")
+
+        cleaner = FileCleaner(config=config)
+        with patch('service.filecleaner.os.scandir', wraps=os.scandir) as mock_scandir:
+            cleaner.clean_all()
+        mock_scandir.assert_called_once_with(str(target_dir))
+
+        # 残ったファイルの更新日時で記録されるため、次回はスキップされる
+        cleaner = FileCleaner(config=config)
+        with patch.object(cleaner, '_clean_directory_tracked') as mock_clean:
+            cleaner.clean_all()
+            mock_clean.assert_not_called()
+
+    def test_changed_directory_is_scanned(self, cache_config, age_file):
+        """ファイルが追加されたディレクトリは再走査されることを確認"""
+        config, target_dir = cache_config
+        FileCleaner(config=config).clean_all()
+
+        cleaner = FileCleaner(config=config)
+        old_file = target_dir / "old.pdf"
+        old_file.write_text("test")
+        age_file(old_file, 25)
+        # ディレクトリの更新日時の粒度に依存しないよう明示的に進める
+        os.utime(target_dir, ns=(0, os.stat(target_dir).st_mtime_ns + 1))
+
+        results = cleaner.clean_all()
+        assert results[str(target_dir)]['deleted_files'] == 1
+        assert not old_file.exists()
+
+    def test_due_file_triggers_rescan(self, cache_config):
+        """残ったファイルが削除期限を迎えた場合は再走査されることを確認"""
+        config, target_dir = cache_config
+        (target_dir / "recent.pdf").write_text("test")
+        FileCleaner(config=config).clean_all()
+
+        config.set('Settings', 'file_cleanup_hour', '-1')
+        cleaner = FileCleaner(config=config)
+        results = cleaner.clean_all()
+        assert results[str(target_dir)]['deleted_files'] == 1
+
+    def test_subdirectory_prevents_caching(self, cache_config):
+        """サブディレクトリが残る場合はキャッシュされないことを確認"""
+        config, target_dir = cache_config
+        subdir = target_dir / "subdir"
+        subdir.mkdir()
+        (subdir / "recent.pdf").write_text("test")
+        FileCleaner(config=config).clean_all()
+
+        cleaner = FileCleaner(config=config)
+        with patch.object(
+            cleaner, '_clean_directory_tracked', return_value=(cleaner._make_result(), None)
+        ) as mock_clean:
+            cleaner.clean_all()
+            mock_clean.assert_called_once_with(str(target_dir))
+
 
 class TestPrintSummary:
     """サマリ出力に関するテスト"""
@@ -682,49 +1060,54 @@ class TestPrintSummary:
 class TestEdgeCases:
     """エッジケースのテスト"""
 
-    def test_file_with_no_extension(self, file_cleaner, tmp_path):
+    def test_file_with_no_extension(self, file_cleaner, tmp_path, age_file):
         """拡張子のないファイルの処理を確認"""
         test_file = tmp_path / "noextension"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         # 拡張子が空文字列として扱われる
         assert file_cleaner._should_delete_file(test_file) is False
 
-    def test_file_with_multiple_dots(self, file_cleaner, tmp_path):
+    def test_file_with_multiple_dots(self, file_cleaner, tmp_path, age_file):
         """複数のドットを持つファイル名の処理を確認"""
         test_file = tmp_path / "file.backup.pdf"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         # 最後の拡張子が使用される
         assert file_cleaner._should_delete_file(test_file) is True
 
-    def test_unicode_file_names(self, file_cleaner, tmp_path):
+    def test_unicode_file_names(self, file_cleaner, tmp_path, age_file):
         """Unicode文字を含むファイル名の処理を確認"""
         test_file = tmp_path / "日本語ファイル.pdf"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         assert file_cleaner._should_delete_file(test_file) is True
         assert file_cleaner._delete_file(test_file) is True
         assert not test_file.exists()
 
-    def test_very_long_path(self, file_cleaner, tmp_path):
+    @pytest.mark.parametrize('name,expected', [
+        ('document.PDF', 'pdf'),
+        ('file.backup.pdf', 'pdf'),
+        ('noextension', ''),
+        ('trailing.', ''),
+        ('.pdf', ''),
+        ('.gitignore', ''),
+        ('..pdf', 'pdf')
+    ])
+    def test_ext_of(self, name, expected):
+        """ファイル名から拡張子が正しく取得されることを確認"""
+        assert FileCleaner._ext_of(name) == expected
+
+    def test_very_long_path(self, file_cleaner, tmp_path, age_file):
         """長いパスの処理を確認"""
         # Windowsの制限内で長いパスを作成
         long_name = "a" * 100
         test_file = tmp_path / f"{long_name}.pdf"
         test_file.write_text("test")
-        old_time = (file_cleaner.app_start_time - timedelta(hours=25)).timestamp()
-        import os
-        os.utime(test_file, (old_time, old_time))
+        age_file(test_file, 25)
 
         assert file_cleaner._should_delete_file(test_file) is True
 
@@ -1,4 +1,5 @@
 import configparser
+import functools
 import os
 import sys
 
@@ -17,24 +18,50 @@ def get_config_path() -> str:
 CONFIG_PATH = get_config_path()
 
 
-def load_config() -> configparser.ConfigParser:
+@functools.lru_cache(maxsize=4)
+def _read_config_data(config_path: str, mtime_ns: int) -> dict[str, dict[str, str]]:
+    # mtime_nsはキャッシュキーとしてのみ使用し、ファイル更新時に再読み込みさせる
     config = configparser.ConfigParser()
+    with open(config_path, encoding='utf-8') as f:
+        config.read_file(f)
+
+    # 補間前の値を保持し、DEFAULTセクションの値は各セクションに重複させない
+    defaults = dict(config.defaults())
+    data = {config.default_section: defaults}
+    for section in config.sections():
+        data[section] = {
+            key: value
+            for key, value in config.items(section, raw=True)
+            if defaults.get(key) != value
+        }
+    return data
+
+
+def load_config() -> configparser.ConfigParser:
     try:
-        with open(CONFIG_PATH, encoding='utf-8') as f:
-            config.read_file(f)
+        data = _read_config_data(CONFIG_PATH, os.stat(CONFIG_PATH).st_mtime_ns)
     except FileNotFoundError:
         print(f"設定ファイルが見つかりません: {CONFIG_PATH}")
         raise
     except configparser.Error as e:
         print(f"設定ファイルの解析中にエラーが発生しました: {e}")
         raise
+
+    # 呼び出し元での変更が他の呼び出し元に影響しないよう、毎回新しいオブジェクトを返す
+    config = configparser.ConfigParser()
+    config.read_dict(data)
     return config
 
 
+def clear_config_cache() -> None:
+    _read_config_data.cache_clear()
+
+
 def save_config(config: configparser.ConfigParser):
     try:
         with open(CONFIG_PATH, 'w', encoding='utf-8') as configfile:
             config.write(configfile)
+        clear_config_cache()
     except IOError as e:
         print(f"設定ファイルの保存中にエラーが発生しました: {e}")
         raise
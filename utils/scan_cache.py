@@ -0,0 +1,34 @@
+import json
+import logging
+import os
+from typing import Any
+
+
+def get_cache_path() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    return os.path.join(base_dir, 'pyfilecleaner', 'cache.json')
+
+
+CACHE_PATH = get_cache_path()
+
+
+def load_cache() -> dict[str, dict[str, Any]]:
+    try:
+        with open(CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"スキャンキャッシュの読み込みに失敗しました: {e}")
+        return {}
+
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache: dict[str, dict[str, Any]]) -> None:
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logging.warning(f"スキャンキャッシュの保存に失敗しました: {e}")